@@ -3,5 +3,8 @@
 from . import brute_force
 from . import rabin_karp
 from . import kmp
+from . import aho_corasick
+from . import regex_search
+from .matcher import KeywordMatcher
 
-__all__ = ['brute_force', 'rabin_karp', 'kmp']
+__all__ = ['brute_force', 'rabin_karp', 'kmp', 'aho_corasick', 'regex_search', 'KeywordMatcher']
@@ -0,0 +1,111 @@
+from collections import deque
+from typing import List, Tuple, Dict
+
+from .matcher import KeywordMatcher
+
+
+ALGORITHM_NAME = 'Aho-Corasick'
+
+
+def build_automaton(patterns: List[str]) -> Tuple[List[Dict[str, int]], List[List[int]]]:
+    goto = [{}]     # trie transitions, state 0 is the root
+    fail = [0]      # failure link of every state
+    output = [[]]   # indices of the patterns that end in every state
+
+    for index, pattern in enumerate(patterns): # Insert every pattern into the trie
+        state = 0
+        for char in pattern:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                goto.append({})
+                fail.append(0)
+                output.append([])
+                next_state = len(goto) - 1
+                goto[state][char] = next_state
+            state = next_state
+        output[state].append(index)
+
+    # Breadth-first walk to compute failure links and merge each state's transitions with
+    # the ones of its failure state, turning the trie into a DFA with one lookup per character
+    delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+    queue = deque(goto[0].values()) # Children of the root keep their failure link to the root
+
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            fail[child] = delta[fail[state]].get(char, 0)
+            output[child] = output[child] + output[fail[child]]
+            queue.append(child)
+
+        delta[state] = {**delta[fail[state]], **goto[state]}
+
+    return delta, output
+
+
+def search_patterns(text: str, patterns: List[str], case_sensitive: bool = False,
+                    first_only: bool = False) -> Tuple[List[List[int]], int]:
+    return search_compiled(text, compile_patterns(patterns, case_sensitive), case_sensitive, first_only)
+
+
+def compile_patterns(patterns: List[str], case_sensitive: bool = False) -> Tuple[List[Dict[str, int]], List[List[Tuple[int, int]]], int, int]:
+    # Convert patterns to lower case for case-insensitive search
+    folded = patterns if case_sensitive else [pattern.lower() for pattern in patterns]
+    
+    # Empty patterns never match, so leave them out of the automaton
+    indices = [i for i, pattern in enumerate(folded) if pattern]
+    delta, output = build_automaton([folded[i] for i in indices])
+    
+    # For every state, the index and length of each original pattern that ends there
+    outputs = [[(indices[k], len(folded[indices[k]])) for k in state_output] for state_output in output]
+    
+    return delta, outputs, len(folded), len(indices)
+
+
+def search_compiled(text: str, compiled: Tuple[List[Dict[str, int]], List[List[Tuple[int, int]]], int, int],
+                    case_sensitive: bool = False, first_only: bool = False) -> Tuple[List[List[int]], int]:
+    if not case_sensitive: # Convert the text to lower case for case-insensitive search
+        text = text.lower()
+    
+    delta, outputs, pattern_count, remaining = compiled
+    positions = [[] for _ in range(pattern_count)]
+    comparisons = 0
+    
+    state = 0
+    for i, char in enumerate(text): # Single pass over the text for all patterns at once
+        if first_only and not remaining: # Every pattern already found
+            break
+        
+        comparisons += 1
+        state = delta[state].get(char, 0)
+        
+        for index, length in outputs[state]: # Every pattern ending here is a match
+            if not positions[index]:
+                remaining -= 1
+            elif first_only:
+                continue
+            positions[index].append(i - length + 1)
+    
+    return positions, comparisons
+
+
+def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False,
+                 presence_only: bool = False, folded: bool = False) -> Dict:
+    """
+    Analyze text for multiple keywords using Aho-Corasick algorithm.
+    
+    Unlike the single pattern algorithms, all keywords are matched in one
+    pass over the text.
+    
+    Args:
+        text: The text to analyze
+        keywords: List of keywords to search for
+        case_sensitive: Whether to perform case-sensitive search
+        presence_only: Stop the scan once every keyword has been found. Only
+            matched/missing keywords are reported and keyword_positions is left out
+        folded: The text is already lower cased, so it is not lower cased again
+    
+    Returns:
+        Dictionary with analysis results
+    """
+    matcher = KeywordMatcher(keywords, case_sensitive, backend='aho_corasick', presence_only=presence_only)
+    return matcher.analyze(text, folded)
@@ -1,12 +1,23 @@
-import time
 from typing import List, Tuple, Dict
 
+from .matcher import KeywordMatcher
 
-def search_pattern(text: str, pattern: str, case_sensitive: bool = False) -> Tuple[List[int], int]:
+
+ALGORITHM_NAME = 'Brute Force'
+
+
+def search_pattern(text: str, pattern: str, case_sensitive: bool = False,
+                   count_comparisons: bool = False, first_only: bool = False) -> Tuple[List[int], int]:
     if not case_sensitive: # Convert both text and pattern to lower case for case-insensitive search
         text = text.lower()
         pattern = pattern.lower()
     
+    return _search_prepared(text, pattern, count_comparisons, first_only)
+
+
+def _search_prepared(text: str, pattern: str, count_comparisons: bool = False,
+                     first_only: bool = False) -> Tuple[List[int], int]:
+    # Search text that has already been case folded by the caller
     positions = []
     comparisons = 0
     n = len(text)
@@ -15,7 +26,34 @@ def search_pattern(text: str, pattern: str, case_sensitive: bool = False) -> Tup
     if m > n or m == 0: # If pattern is longer than text or empty, return no matches
         return positions, comparisons
     
-    for i in range(n - m + 1): # Slide pattern over text
+    if not count_comparisons: # Fast path: let str.find do the scanning in C
+        i = text.find(pattern)
+        while i != -1:
+            positions.append(i)
+            if first_only:
+                break
+            i = text.find(pattern, i + 1)
+        
+        # Comparisons are hidden inside str.find, so report the brute force best case:
+        # one comparison per window scanned plus the remaining characters of every match
+        windows = positions[0] + 1 if first_only and positions else n - m + 1
+        comparisons = windows + len(positions) * (m - 1)
+        return positions, comparisons
+    
+    first = pattern[0]
+    last_window = n - m
+    i = 0
+    
+    while i <= last_window: # Slide pattern over text
+        # A window that does not start with the first pattern character fails on its first
+        # comparison, so jump to the next candidate window and count the skipped ones in bulk
+        candidate = text.find(first, i, last_window + 1)
+        if candidate == -1:
+            comparisons += last_window + 1 - i
+            break
+        comparisons += candidate - i
+        i = candidate
+        
         j = 0
         while j < m:
             comparisons += 1
@@ -25,11 +63,36 @@ def search_pattern(text: str, pattern: str, case_sensitive: bool = False) -> Tup
         
         if j == m:  # Pattern found
             positions.append(i)
+            if first_only:
+                break
+        i += 1
     
     return positions, comparisons
 
 
-def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False) -> Dict:
+def compile_patterns(patterns: List[str], case_sensitive: bool = False) -> List[str]:
+    # Case fold the keywords once so they can be reused for many texts
+    return list(patterns) if case_sensitive else [pattern.lower() for pattern in patterns]
+
+
+def search_compiled(text: str, patterns: List[str], case_sensitive: bool = False, first_only: bool = False,
+                    count_comparisons: bool = False) -> Tuple[List[List[int]], int]:
+    if not case_sensitive: # Lower case the text once instead of once per keyword
+        text = text.lower()
+    
+    all_positions = []
+    total_comparisons = 0
+    
+    for pattern in patterns: # Search each keyword in the text
+        positions, comparisons = _search_prepared(text, pattern, count_comparisons, first_only)
+        all_positions.append(positions)
+        total_comparisons += comparisons
+    
+    return all_positions, total_comparisons
+
+
+def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False,
+                 count_comparisons: bool = False, presence_only: bool = False, folded: bool = False) -> Dict:
     """
     Analyze text for multiple keywords using brute force algorithm.
     
@@ -37,40 +100,15 @@ def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False) -
         text: The text to analyze
         keywords: List of keywords to search for
         case_sensitive: Whether to perform case-sensitive search
+        count_comparisons: Run the character-by-character loop to get exact
+            comparison counts instead of the faster str.find based search
+        presence_only: Stop searching each keyword at its first match. Only
+            matched/missing keywords are reported and keyword_positions is left out
+        folded: The text is already lower cased, so it is not lower cased again
         
     Returns:
         Dictionary with analysis results
     """
-    start_time = time.time()
-    
-    matched_keywords = []
-    missing_keywords = []
-    total_comparisons = 0
-    keyword_positions = {}
-    
-    for keyword in keywords: # Search each keyword in the text
-        positions, comparisons = search_pattern(text, keyword, case_sensitive)
-        total_comparisons += comparisons
-        
-        if positions:# If keyword is found, record its positions
-            matched_keywords.append(keyword)
-            keyword_positions[keyword] = len(positions)
-        else: # If keyword is not found, record it as missing
-            missing_keywords.append(keyword)
-    
-    execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-    
-    total_keywords = len(keywords)
-    relevance_score = (len(matched_keywords) / total_keywords * 100) if total_keywords > 0 else 0
-    
-    return {
-        'algorithm': 'Brute Force',
-        'matched_keywords': matched_keywords,
-        'missing_keywords': missing_keywords,
-        'matches': len(matched_keywords),
-        'total_keywords': total_keywords,
-        'relevance_score': round(relevance_score, 2),
-        'comparisons': total_comparisons,
-        'execution_time': round(execution_time, 3),
-        'keyword_positions': keyword_positions
-    }
+    matcher = KeywordMatcher(keywords, case_sensitive, backend='brute_force',
+                             presence_only=presence_only, count_comparisons=count_comparisons)
+    return matcher.analyze(text, folded)
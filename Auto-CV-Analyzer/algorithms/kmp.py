@@ -1,8 +1,14 @@
-import time
+from functools import lru_cache
 from typing import List, Tuple, Dict
 
+from .matcher import KeywordMatcher
 
-def compute_lps(pattern: str) -> List[int]:
+
+ALGORITHM_NAME = 'KMP'
+
+
+@lru_cache(maxsize=1024)
+def compute_lps(pattern: str) -> Tuple[int, ...]:
     m = len(pattern)
     lps = [0] * m
     length = 0
@@ -20,48 +26,87 @@ def compute_lps(pattern: str) -> List[int]:
                 lps[i] = 0
                 i += 1
     
-    return lps
+    return tuple(lps)   # Immutable, since results are shared through the cache
 
 
-def search_pattern(text: str, pattern: str, case_sensitive: bool = False) -> Tuple[List[int], int]:
+def search_pattern(text: str, pattern: str, case_sensitive: bool = False,
+                   first_only: bool = False) -> Tuple[List[int], int]:
     if not case_sensitive: # Convert both text and pattern to lower case for case-insensitive search
         text = text.lower()
         pattern = pattern.lower()
     
+    return _search_prepared(text, pattern, compute_lps(pattern), first_only)
+
+
+def _search_prepared(text: str, pattern: str, lps: Tuple[int, ...],
+                     first_only: bool = False) -> Tuple[List[int], int]:
+    # Search text that has already been case folded by the caller, using the pattern's LPS array
     positions = []
-    comparisons = 0
     n = len(text)
     m = len(pattern)
     
     if m > n or m == 0: # If pattern is longer than text or empty, return no matches
-        return positions, comparisons
+        return positions, 0
     
-    # Compute LPS array
-    lps = compute_lps(pattern)
+    # Every iteration compares exactly one character and then either advances in the text or
+    # falls back in the pattern, so the comparisons are the characters passed plus the fallbacks.
+    # Only the (rarer) fallbacks are counted in the loop.
+    fallbacks = 0
     
     i = 0  # index for text
     j = 0  # index for pattern
+    first = pattern[0]
     
     while i < n:    # Slide the pattern over text and compare characters, using LPS to skip unnecessary comparisons
-        comparisons += 1
+        if j == 0:
+            # With no partial match every character is compared once against the first pattern
+            # character, so jump to its next occurrence (the skipped characters count as passed)
+            i = text.find(first, i)
+            if i == -1:
+                i = n
+                break
         
         if text[i] == pattern[j]:
             i += 1
             j += 1
-        
-        if j == m:
-            positions.append(i - j)
-            j = lps[j - 1]
-        elif i < n and text[i] != pattern[j]:
-            if j != 0:
+            if j == m:
+                positions.append(i - m)
+                if first_only:
+                    break
                 j = lps[j - 1]
-            else:
-                i += 1
+        elif j != 0:
+            fallbacks += 1
+            j = lps[j - 1]
+        else:
+            i += 1
     
-    return positions, comparisons
+    return positions, i + fallbacks
 
 
-def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False) -> Dict:
+def compile_patterns(patterns: List[str], case_sensitive: bool = False) -> List[Tuple[str, Tuple[int, ...]]]:
+    # Case fold the keywords and compute their LPS arrays once so they can be reused for many texts
+    folded = patterns if case_sensitive else [pattern.lower() for pattern in patterns]
+    return [(pattern, compute_lps(pattern)) for pattern in folded]
+
+
+def search_compiled(text: str, patterns: List[Tuple[str, Tuple[int, ...]]], case_sensitive: bool = False,
+                    first_only: bool = False) -> Tuple[List[List[int]], int]:
+    if not case_sensitive: # Lower case the text once instead of once per keyword
+        text = text.lower()
+    
+    all_positions = []
+    total_comparisons = 0
+    
+    for pattern, lps in patterns:
+        positions, comparisons = _search_prepared(text, pattern, lps, first_only)
+        all_positions.append(positions)
+        total_comparisons += comparisons
+    
+    return all_positions, total_comparisons
+
+
+def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False,
+                 presence_only: bool = False, folded: bool = False) -> Dict:
     """
     Analyze text for multiple keywords using KMP algorithm.
     
@@ -69,40 +114,12 @@ def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False) -
         text: The text to analyze
         keywords: List of keywords to search for
         case_sensitive: Whether to perform case-sensitive search
+        presence_only: Stop searching each keyword at its first match. Only
+            matched/missing keywords are reported and keyword_positions is left out
+        folded: The text is already lower cased, so it is not lower cased again
         
     Returns:
         Dictionary with analysis results
     """
-    start_time = time.time()
-    
-    matched_keywords = []
-    missing_keywords = []
-    total_comparisons = 0
-    keyword_positions = {}
-    
-    for keyword in keywords:
-        positions, comparisons = search_pattern(text, keyword, case_sensitive)
-        total_comparisons += comparisons
-        
-        if positions:
-            matched_keywords.append(keyword)
-            keyword_positions[keyword] = len(positions)
-        else:
-            missing_keywords.append(keyword)
-    
-    execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-    
-    total_keywords = len(keywords)
-    relevance_score = (len(matched_keywords) / total_keywords * 100) if total_keywords > 0 else 0
-    
-    return {
-        'algorithm': 'KMP',
-        'matched_keywords': matched_keywords,
-        'missing_keywords': missing_keywords,
-        'matches': len(matched_keywords),
-        'total_keywords': total_keywords,
-        'relevance_score': round(relevance_score, 2),
-        'comparisons': total_comparisons,
-        'execution_time': round(execution_time, 3),
-        'keyword_positions': keyword_positions
-    }
+    matcher = KeywordMatcher(keywords, case_sensitive, backend='kmp', presence_only=presence_only)
+    return matcher.analyze(text, folded)
@@ -0,0 +1,101 @@
+"""
+Keyword matcher that prepares a keyword set once and reuses it across texts.
+"""
+
+import time
+from importlib import import_module
+from typing import List, Dict
+
+
+# Algorithm modules that can be used as matcher backends
+BACKENDS = ('brute_force', 'rabin_karp', 'kmp', 'aho_corasick', 'regex_search')
+
+
+class KeywordMatcher:
+    """
+    Keyword set compiled for one string matching algorithm.
+
+    All per-keyword preparation (case folding, KMP prefix tables, Rabin-Karp
+    pattern hashes, the Aho-Corasick automaton, the compiled regex) is done
+    once when the matcher is created, so analyzing many CVs against the same
+    job keywords only costs the text scans.
+    """
+
+    def __init__(self, keywords: List[str], case_sensitive: bool = False, backend: str = 'kmp',
+                 presence_only: bool = False, **search_options):
+        """
+        Compile keywords for the given algorithm.
+
+        Args:
+            keywords: List of keywords to search for
+            case_sensitive: Whether to perform case-sensitive search
+            backend: Name of the algorithm module to use (see BACKENDS)
+            presence_only: Stop searching each keyword at its first match. Only
+                matched/missing keywords are reported and keyword_positions is left out
+            search_options: Extra options for the algorithm's search (e.g. count_comparisons)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown matcher backend: {backend}")
+
+        self.keywords = list(keywords)
+        self.backend = backend
+        self.case_sensitive = case_sensitive
+        self.presence_only = presence_only
+        self.search_options = search_options
+        self.algorithm = import_module(f'{__package__}.{backend}')
+        self.compiled = self.algorithm.compile_patterns(self.keywords, case_sensitive)
+
+    def analyze(self, text: str, folded: bool = False) -> Dict:
+        """
+        Analyze text for the compiled keywords.
+
+        Args:
+            text: The text to analyze
+            folded: The text is already lower cased, so the algorithm does not lower case it
+                again. Lets the caller fold a CV once and share it between several matchers
+
+        Returns:
+            Dictionary with analysis results
+        """
+        start = time.perf_counter_ns() # Monotonic, nanosecond resolution timer
+
+        matched_keywords = []
+        missing_keywords = []
+        keyword_positions = {}
+
+        all_positions, total_comparisons = self.algorithm.search_compiled(
+            text,
+            self.compiled,
+            self.case_sensitive or folded,  # The keywords are folded at compile time, this only affects the text
+            first_only=self.presence_only,
+            **self.search_options
+        )
+
+        for keyword, positions in zip(self.keywords, all_positions):
+            if positions: # If keyword is found, record its positions
+                matched_keywords.append(keyword)
+                if not self.presence_only:
+                    keyword_positions[keyword] = len(positions)
+            else: # If keyword is not found, record it as missing
+                missing_keywords.append(keyword)
+
+        execution_time = (time.perf_counter_ns() - start) / 1e6  # Convert to milliseconds
+
+        total_keywords = len(self.keywords)
+        relevance_score = (len(matched_keywords) / total_keywords * 100) if total_keywords > 0 else 0
+
+        result = {
+            'algorithm': self.algorithm.ALGORITHM_NAME,
+            'matched_keywords': matched_keywords,
+            'missing_keywords': missing_keywords,
+            'matches': len(matched_keywords),
+            'total_keywords': total_keywords,
+            'relevance_score': round(relevance_score, 2),
+            'comparisons': total_comparisons,
+            'execution_time': round(execution_time, 3)
+        }
+
+        if not self.presence_only: # Presence-only searches stop at each keyword's first match, so there are no counts
+            result['keyword_positions'] = keyword_positions
+
+        return result
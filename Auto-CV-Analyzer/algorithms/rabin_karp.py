@@ -1,106 +1,174 @@
-import time
-from typing import List, Tuple, Dict
+from functools import reduce
+from itertools import chain
+from typing import List, Tuple, Dict, Sequence
 
+from .matcher import KeywordMatcher
 
-def search_pattern(text: str, pattern: str, case_sensitive: bool = False, prime: int = 101) -> Tuple[List[int], int]:
-    if not case_sensitive: # Convert both text and pattern to lower case for case-insensitive search
+
+ALGORITHM_NAME = 'Rabin-Karp'
+
+# Base for hash calculation (256 for extended ASCII)
+BASE = 256
+
+# Mersenne prime 2^61 - 1 used as hash modulus. A small modulus such as 101 makes unrelated
+# windows collide about once every hundred positions, each collision forcing a character by
+# character check; with 2^61 - 1 false positives are practically nonexistent.
+MERSENNE_PRIME = (1 << 61) - 1
+
+def char_codes(text: str, case_sensitive: bool = True) -> Sequence[int]:
+    # Fold first: characters beyond Latin-1 such as 'ẞ' or the Kelvin sign lower case into Latin-1,
+    # so the representation must be chosen for the folded text
+    if not case_sensitive:
         text = text.lower()
-        pattern = pattern.lower()
-    
-    positions = []
-    comparisons = 0
-    n = len(text)
-    m = len(pattern)
-    
-    if m > n or m == 0: # If pattern is longer than text or empty, return no matches
-        return positions, comparisons
     
-    # Base for hash calculation (256 for extended ASCII)
-    d = 256 
+    try: # Latin-1 stores each character as one byte equal to its code point, so indexing gives ord() for free
+        return text.encode('latin-1')
+    except UnicodeEncodeError: # Characters beyond Latin-1 need the full code point list
+        return list(map(ord, text))
+
+
+def polynomial_hash(codes: Sequence[int], base: int, prime: int) -> int:
+    return reduce(lambda value, code: (value * base + code) % prime, codes, 0)
+
+
+def search_pattern(text: str, pattern: str, case_sensitive: bool = False, prime: int = MERSENNE_PRIME,
+                   first_only: bool = False) -> Tuple[List[int], int]:
+    positions, comparisons = search_patterns(text, [pattern], case_sensitive, prime, first_only)
+    return positions[0], comparisons
+
+
+def search_patterns(text: str, patterns: List[str], case_sensitive: bool = False, prime: int = MERSENNE_PRIME,
+                    first_only: bool = False) -> Tuple[List[List[int]], int]:
+    compiled = compile_patterns(patterns, case_sensitive, prime)
+    return search_compiled(text, compiled, case_sensitive, first_only)
+
+
+def compile_patterns(patterns: List[str], case_sensitive: bool = False,
+                     prime: int = MERSENNE_PRIME) -> Tuple[List[Sequence[int]], Dict[int, Dict[int, List[int]]], int]:
+    # Character codes of the patterns, lower cased for case-insensitive search
+    patterns_codes = [char_codes(pattern, case_sensitive) for pattern in patterns]
     
-    # Calculate hash value for pattern and first window of text
-    pattern_hash = 0
-    text_hash = 0
-    h = 1
+    # Patterns of the same length can share one rolling hash over the text, so group their hashes by length
+    hash_tables = {}
+    for index, pattern_codes in enumerate(patterns_codes):
+        if pattern_codes: # Empty patterns have no matches
+            pattern_hash = polynomial_hash(pattern_codes, BASE, prime)
+            hash_tables.setdefault(len(pattern_codes), {}).setdefault(pattern_hash, []).append(index)
     
-    # Calculate h = d^(m-1) % prime
-    for i in range(m - 1):
-        h = (h * d) % prime
+    return patterns_codes, hash_tables, prime
+
+
+def search_compiled(text: str, compiled: Tuple[List[Sequence[int]], Dict[int, Dict[int, List[int]]], int],
+                    case_sensitive: bool = False, first_only: bool = False) -> Tuple[List[List[int]], int]:
+    # Convert (and case fold) the text once instead of once per keyword or per character
+    return _search_prepared(char_codes(text, case_sensitive), *compiled, first_only)
+
+
+def _search_prepared(text_codes: Sequence[int], patterns_codes: List[Sequence[int]],
+                     hash_tables: Dict[int, Dict[int, List[int]]], prime: int = MERSENNE_PRIME,
+                     first_only: bool = False) -> Tuple[List[List[int]], int]:
+    # Search character codes of text and patterns already case folded by the caller
+    positions = [[] for _ in patterns_codes]
+    comparisons = 0
+    n = len(text_codes)
+    d = BASE
     
-    # Calculate initial hash values
-    for i in range(m):
-        pattern_hash = (d * pattern_hash + ord(pattern[i])) % prime
-        text_hash = (d * text_hash + ord(text[i])) % prime
+    # Slices of the text only compare equal to the same sequence type, so give every pattern the text's type.
+    # A pattern with codes beyond Latin-1 stays a list against byte text, where it can never occur
+    if isinstance(text_codes, bytes):
+        patterns_codes = [
+            bytes(pattern_codes) if not isinstance(pattern_codes, bytes) and max(pattern_codes, default=0) < 256
+            else pattern_codes
+            for pattern_codes in patterns_codes
+        ]
+    else:
+        patterns_codes = [list(pattern_codes) for pattern_codes in patterns_codes]
+        text_alphabet = set(text_codes)
     
-    # Slide the pattern over text
-    for i in range(n - m + 1):
-        comparisons += 1  # Hash comparison
+    for m, hashes in hash_tables.items():
+        if m > n: # If pattern is longer than text, return no matches
+            continue
+        
+        # Calculate h = d^(m-1) % prime, the weight of the character leaving the window
+        h = pow(d, m - 1, prime)
+        
+        # Amount each character code adds to the hash when it leaves the window, -(code * h * d) % prime.
+        # Looking it up (list for bytes, dict for code points) saves a multiplication at every step
+        if isinstance(text_codes, bytes):
+            outgoing_weights = [(-code * h * d) % prime for code in range(256)]
+        else:
+            outgoing_weights = {code: (-code * h * d) % prime for code in text_alphabet}
+        
+        # Short windows of byte codes fit below the modulus (up to 7 characters for 2^61 - 1), so their
+        # hash is the window packed into one integer and a hash match needs no character check
+        packed = d ** m <= prime and isinstance(text_codes, bytes)
+        
+        # Copy of the pattern hashes of this length, found patterns are removed from it in first_only mode
+        pattern_hashes = {value: list(indices) for value, indices in hashes.items()}
+        
+        # Calculate hash value for the first window of text
+        text_hash = polynomial_hash(text_codes[:m], d, prime)
+        
+        # Pair the character leaving each window with the one entering the next window. The last
+        # window has no successor, so a dummy 0 is appended instead of checking for the end every step
+        incoming_codes = chain(text_codes[m:], (0,))
+        
+        # One hash lookup per window, counted once after the loop instead of at every step
+        windows = n - m + 1
         
-        # If hash values match, check character by character
-        if pattern_hash == text_hash:
-            match = True
-            for j in range(m):
-                comparisons += 1
-                if text[i + j] != pattern[j]:
-                    match = False
+        # Slide one window over text for all patterns of this length
+        for i, (outgoing, incoming) in enumerate(zip(text_codes, incoming_codes)):
+            # If the window hash belongs to a pattern, check it character by character
+            candidates = pattern_hashes.get(text_hash)
+            if candidates:
+                for index in list(candidates):
+                    pattern_codes = patterns_codes[index]
+                    if packed and isinstance(pattern_codes, bytes):
+                        match = True
+                    else: # Compare the whole window in one slice comparison (memcmp for bytes)
+                        match = text_codes[i:i + m] == pattern_codes
+                        if match:
+                            comparisons += m
+                        else: # Rare with a large prime, count the characters up to the first difference
+                            comparisons += next((j for j in range(m) if text_codes[i + j] != pattern_codes[j]), m - 1) + 1
+                    
+                    if match:
+                        positions[index].append(i)
+                        if first_only: # Pattern found, stop looking for it
+                            candidates.remove(index)
+                            if not candidates:
+                                del pattern_hashes[text_hash]
+                
+                if not pattern_hashes: # Every pattern of this length already found
+                    windows = i + 1
                     break
             
-            if match:
-                positions.append(i)
+            # Calculate hash for next window (% with a positive modulus never returns a negative value)
+            text_hash = (d * text_hash + outgoing_weights[outgoing] + incoming) % prime
         
-        # Calculate hash for next window
-        if i < n - m:
-            text_hash = (d * (text_hash - ord(text[i]) * h) + ord(text[i + m])) % prime
-            
-            # Handle negative hash
-            if text_hash < 0:
-                text_hash += prime
+        comparisons += windows
     
     return positions, comparisons
 
 
-def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False) -> Dict:
+def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False,
+                 presence_only: bool = False, folded: bool = False) -> Dict:
     """
     Analyze text for multiple keywords using Rabin-Karp algorithm.
     
+    Keywords of equal length are matched together: one rolling hash is slid
+    over the text and looked up in a table of their hashes.
+    
     Args:
         text: The text to analyze
         keywords: List of keywords to search for
         case_sensitive: Whether to perform case-sensitive search
+        presence_only: Stop searching each keyword at its first match. Only
+            matched/missing keywords are reported and keyword_positions is left out
+        folded: The text is already lower cased, so it is not lower cased again
         
     Returns:
         Dictionary with analysis results
     """
-    start_time = time.time()
-    
-    matched_keywords = []
-    missing_keywords = []
-    total_comparisons = 0
-    keyword_positions = {}
-    
-    for keyword in keywords:
-        positions, comparisons = search_pattern(text, keyword, case_sensitive)
-        total_comparisons += comparisons
-        
-        if positions:
-            matched_keywords.append(keyword)
-            keyword_positions[keyword] = len(positions)
-        else:
-            missing_keywords.append(keyword)
-    
-    execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-    
-    total_keywords = len(keywords)
-    relevance_score = (len(matched_keywords) / total_keywords * 100) if total_keywords > 0 else 0
-    
-    return {
-        'algorithm': 'Rabin-Karp',
-        'matched_keywords': matched_keywords,
-        'missing_keywords': missing_keywords,
-        'matches': len(matched_keywords),
-        'total_keywords': total_keywords,
-        'relevance_score': round(relevance_score, 2),
-        'comparisons': total_comparisons,
-        'execution_time': round(execution_time, 3),
-        'keyword_positions': keyword_positions
-    }
+    matcher = KeywordMatcher(keywords, case_sensitive, backend='rabin_karp', presence_only=presence_only)
+    return matcher.analyze(text, folded)
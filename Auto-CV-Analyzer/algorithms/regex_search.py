@@ -0,0 +1,74 @@
+import re
+from typing import List, Tuple, Dict, Pattern, Optional
+
+from .matcher import KeywordMatcher
+
+
+ALGORITHM_NAME = 'Regex'
+
+
+def compile_patterns(keywords: List[str], case_sensitive: bool = False) -> Tuple[Optional[Pattern], Dict[str, List[int]], int]:
+    # Convert keywords to lower case for case-insensitive search
+    folded = keywords if case_sensitive else [keyword.lower() for keyword in keywords]
+    unique_keywords = sorted({keyword for keyword in folded if keyword}, key=len, reverse=True)
+    
+    if not unique_keywords: # An empty alternation would match at every position
+        return None, {}, len(folded)
+    
+    # The alternation sits inside a lookahead so that overlapping occurrences are found, and
+    # longer keywords come first so each position reports the longest keyword starting there
+    alternation = '|'.join(re.escape(keyword) for keyword in unique_keywords)
+    pattern = re.compile(f'(?=({alternation}))')
+    
+    # Every other keyword starting at the same position is a prefix of the longest one, so map
+    # each possible longest match to the indices of all keywords it stands for
+    prefixes = {
+        longer: [i for i, keyword in enumerate(folded) if keyword and longer.startswith(keyword)]
+        for longer in unique_keywords
+    }
+    
+    return pattern, prefixes, len(folded)
+
+
+def search_compiled(text: str, compiled: Tuple[Optional[Pattern], Dict[str, List[int]], int],
+                    case_sensitive: bool = False, first_only: bool = False) -> Tuple[List[List[int]], int]:
+    if not case_sensitive: # Convert the text to lower case for case-insensitive search
+        text = text.lower()
+    
+    pattern, prefixes, keyword_count = compiled
+    positions = [[] for _ in range(keyword_count)]
+    
+    # The comparisons happen inside the regex engine, so report the number of positions scanned
+    comparisons = len(text)
+    
+    if pattern is None:
+        return positions, comparisons
+    
+    for match in pattern.finditer(text): # Single pass of the C regex engine over the text for all keywords
+        for index in prefixes[match.group(1)]:
+            if not (first_only and positions[index]):
+                positions[index].append(match.start())
+    
+    return positions, comparisons
+
+
+def analyze_text(text: str, keywords: List[str], case_sensitive: bool = False,
+                 presence_only: bool = False, folded: bool = False) -> Dict:
+    """
+    Analyze text for multiple keywords using a single compiled regular expression.
+    
+    The comparisons are done inside the regex engine, so the reported count
+    is the number of text positions scanned.
+    
+    Args:
+        text: The text to analyze
+        keywords: List of keywords to search for
+        case_sensitive: Whether to perform case-sensitive search
+        presence_only: Only report matched/missing keywords and leave keyword_positions out
+        folded: The text is already lower cased, so it is not lower cased again
+    
+    Returns:
+        Dictionary with analysis results
+    """
+    matcher = KeywordMatcher(keywords, case_sensitive, backend='regex_search', presence_only=presence_only)
+    return matcher.analyze(text, folded)
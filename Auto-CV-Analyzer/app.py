@@ -1,18 +1,20 @@
 """
 Intelligent CV Analyzer - Streamlit Web Application
-Analyzes CVs using Brute Force, Rabin-Karp, and KMP string matching algorithms.
+Analyzes CVs using Brute Force, Rabin-Karp, KMP, Aho-Corasick, and regex string matching.
 """
 
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import altair as alt
 import json
+import orjson
 import os
 from datetime import datetime
 
 # Import custom modules
-from algorithms import brute_force, rabin_karp, kmp
+from algorithms import KeywordMatcher
 from utils import file_reader, text_cleaner, performance_metrics
 
 # Page configuration
@@ -50,6 +52,24 @@ st.markdown("""
 # Dataset directory path
 DEFAULT_CV_DIRECTORY = r"D:\Uni Material\Sem 5\Design and Analysis of Algorithms\Assignment 2\DataSet\DataSet"
 
+# Maximum number of progress bar updates per run, each update is a message to the browser
+PROGRESS_UPDATES = 50
+
+
+@st.cache_data(show_spinner=False)
+def extract_file_text(file_content: bytes, filename: str) -> str:
+    """
+    Extract text from an uploaded file, cached on the file content so re-uploads and reruns skip parsing.
+    
+    Args:
+        file_content: Binary content of the file
+        filename: Name of the file (used to detect the file type)
+        
+    Returns:
+        Extracted text as string
+    """
+    return file_reader.read_file(file_content=file_content, filename=filename)
+
 
 def main():
     # Header
@@ -66,20 +86,36 @@ def main():
         use_brute_force = st.checkbox("Brute Force", value=True)
         use_rabin_karp = st.checkbox("Rabin-Karp", value=True)
         use_kmp = st.checkbox("KMP", value=True)
+        use_aho_corasick = st.checkbox("Aho-Corasick", value=False, help="Matches all keywords in a single pass over each CV")
+        use_regex = st.checkbox("Regex", value=False, help="Matches all keywords with one compiled regular expression, scanned in C")
         
         algorithms_selected = []
         if use_brute_force:
-            algorithms_selected.append(('Brute Force', brute_force))
+            algorithms_selected.append(('Brute Force', 'brute_force'))
         if use_rabin_karp:
-            algorithms_selected.append(('Rabin-Karp', rabin_karp))
+            algorithms_selected.append(('Rabin-Karp', 'rabin_karp'))
         if use_kmp:
-            algorithms_selected.append(('KMP', kmp))
+            algorithms_selected.append(('KMP', 'kmp'))
+        if use_aho_corasick:
+            algorithms_selected.append(('Aho-Corasick', 'aho_corasick'))
+        if use_regex:
+            algorithms_selected.append(('Regex', 'regex_search'))
         
         st.divider()
         
         # Case sensitivity
         case_sensitive = st.checkbox("Case Sensitive Matching", value=False)
         
+        # Full scan
+        full_scan = st.checkbox(
+            "Full scan: count keyword occurrences and comparisons",
+            value=False,
+            help="Scan the whole CV for every keyword, counting how often each keyword occurs "
+                 "(keyword_positions in the JSON export) and every character comparison. Slower. "
+                 "When off, each keyword's search stops at its first match, so exports only list "
+                 "matched and missing keywords and the comparison counts are estimates."
+        )
+        
         st.divider()
         
         # About
@@ -87,10 +123,12 @@ def main():
             st.write("""
             **Intelligent CV Analyzer**
             
-            This application uses three classical string matching algorithms to analyze CVs:
+            This application uses classical string matching algorithms to analyze CVs:
             - **Brute Force**: Simple pattern matching
             - **Rabin-Karp**: Hash-based matching
             - **KMP**: Efficient pattern matching with prefix function
+            - **Aho-Corasick**: Automaton matching all keywords in one pass
+            - **Regex**: All keywords in one compiled regular expression, scanned in C
             
             **How to use:**
             1. Upload or enter a job description
@@ -117,7 +155,8 @@ def main():
             )
             
             if uploaded_file:
-                file_content = uploaded_file.read()
+                # getvalue() returns the whole file without moving the read cursor, so every rerun sees the same bytes
+                file_content = uploaded_file.getvalue()
                 
                 # Special handling for TXT files (expected format: line 1 = title, line 2 = skills)
                 if uploaded_file.name.lower().endswith('.txt'):
@@ -141,7 +180,7 @@ def main():
                     # Parse JSON format
                     try:
                         text = file_content.decode('utf-8')
-                        data = json.loads(text)
+                        data = file_reader.load_json(file_content)
                         
                         if 'title' in data:
                             st.session_state['job_title'] = data['title']
@@ -156,13 +195,13 @@ def main():
                         
                         with st.expander("📄 View JSON Content"):
                             st.json(data)
-                    except json.JSONDecodeError:
+                    except json.JSONDecodeError: # Also covers orjson.JSONDecodeError, which subclasses it
                         st.error("❌ Invalid JSON format")
                     except Exception as e:
                         st.error(f"❌ Error parsing JSON: {str(e)}")
                 else:
                     # For PDF, DOCX - extract full text
-                    job_text = file_reader.read_file(file_content=file_content, filename=uploaded_file.name)
+                    job_text = extract_file_text(file_content, uploaded_file.name)
                     st.session_state['job_text'] = job_text
                     
                     with st.expander("📄 View Extracted Text"):
@@ -266,8 +305,11 @@ def main():
                             "saved_at": datetime.now().isoformat()
                         }
                         
-                        with open(json_filename, 'w', encoding='utf-8') as f:
-                            json.dump(json_content, f, indent=2)
+                        # Encode once and reuse the bytes for the file and the download button
+                        json_bytes = orjson.dumps(json_content, option=orjson.OPT_INDENT_2)
+                        
+                        with open(json_filename, 'wb') as f:
+                            f.write(json_bytes)
                         
                         st.success(f"✅ Saved successfully!")
                         st.info(f"📁 **TXT:** `{txt_filename}`")
@@ -288,7 +330,7 @@ def main():
                         with col_dl2:
                             st.download_button(
                                 label="⬇️ Download JSON",
-                                data=json.dumps(json_content, indent=2),
+                                data=json_bytes,
                                 file_name=f"{safe_filename}.json",
                                 mime="application/json",
                                 use_container_width=True
@@ -332,12 +374,18 @@ def main():
                     extraction_progress = st.progress(0)
                     extraction_status = st.empty()
                     
-                    for i, uploaded_file in enumerate(uploaded_cvs):
-                        extraction_status.text(f"Extracting text from {uploaded_file.name}...")
+                    update_every = max(1, len(uploaded_cvs) // PROGRESS_UPDATES)
+                    
+                    # Extract the files one after another. The uploads are already in memory and the parsers are
+                    # pure Python holding the GIL, so a thread pool would have nothing to overlap
+                    for done, uploaded_file in enumerate(uploaded_cvs, 1):
+                        # Only refresh the page every few files, like the analysis progress below
+                        refresh = done % update_every == 0 or done == len(uploaded_cvs)
+                        if refresh:
+                            extraction_status.text(f"Extracting text from {uploaded_file.name}...")
                         
                         try:
-                            file_content = uploaded_file.read()
-                            cv_text = file_reader.read_file(file_content=file_content, filename=uploaded_file.name)
+                            cv_text = extract_file_text(uploaded_file.getvalue(), uploaded_file.name)
                             
                             if cv_text and not cv_text.startswith("Error"):
                                 cvs[uploaded_file.name] = cv_text
@@ -346,7 +394,8 @@ def main():
                         except Exception as e:
                             st.warning(f"⚠️ Error processing {uploaded_file.name}: {str(e)}")
                         
-                        extraction_progress.progress((i + 1) / len(uploaded_cvs))
+                        if refresh:
+                            extraction_progress.progress(done / len(uploaded_cvs))
                     
                     extraction_progress.empty()
                     extraction_status.empty()
@@ -362,31 +411,100 @@ def main():
                         progress_bar = st.progress(0)
                         status_text = st.empty()
                         
-                        total_operations = len(cvs) * len(algorithms_selected)
-                        current_operation = 0
+                        # Prepare the keywords once per algorithm and reuse them for every CV. Matchers are kept
+                        # in the session so the automaton and tables are not rebuilt when the analysis is rerun
+                        if 'matchers' not in st.session_state:
+                            st.session_state['matchers'] = {}
                         
-                        for cv_file, cv_text in cvs.items():
-                            cv_results[cv_file] = []
-                            
-                            for algo_name, algo_module in algorithms_selected:
-                                status_text.text(f"Analyzing {cv_file} with {algo_name}...")
+                        keywords = tuple(st.session_state['keywords'])
+                        
+                        matchers = []
+                        for algo_name, backend in algorithms_selected:
+                            matcher_key = (backend, keywords, case_sensitive, full_scan)
+                            if matcher_key not in st.session_state['matchers']:
+                                # Brute force counts comparisons character by character only in a full scan,
+                                # otherwise it searches with str.find in C
+                                search_options = {'count_comparisons': True} if full_scan and backend == 'brute_force' else {}
                                 
-                                result = algo_module.analyze_text(
-                                    cv_text,
+                                # Without a full scan only matched/missing keywords are reported, so stop at each
+                                # keyword's first match
+                                st.session_state['matchers'][matcher_key] = KeywordMatcher(
                                     st.session_state['keywords'],
-                                    case_sensitive=case_sensitive
+                                    case_sensitive=case_sensitive,
+                                    backend=backend,
+                                    presence_only=not full_scan,
+                                    **search_options
                                 )
-                                
-                                cv_results[cv_file].append(result)
-                                
-                                current_operation += 1
-                                progress_bar.progress(current_operation / total_operations)
+                            matchers.append((algo_name, matcher_key, st.session_state['matchers'][matcher_key]))
+                        
+                        # Only keep the matchers of this run, so changing keywords or options does not pile up
+                        # automata and compiled patterns for the rest of the session
+                        st.session_state['matchers'] = {
+                            matcher_key: matcher for algo_name, matcher_key, matcher in matchers
+                        }
+                        
+                        # Results are cached per CV text and matcher, so rerunning with the same CVs and keywords
+                        # only analyzes the new combinations
+                        if 'analysis_cache' not in st.session_state:
+                            st.session_state['analysis_cache'] = {}
+                        analysis_cache = st.session_state['analysis_cache']
+                        
+                        result_keys = {}
+                        tasks = {}
+                        for cv_file, cv_text in cvs.items():
+                            # Keyed on the text itself: the string caches its hash, and a hash collision between two
+                            # CVs is resolved by comparing the texts instead of returning the other CV's results
+                            result_keys[cv_file] = []
+                            
+                            # Lower case each CV once and share it between all algorithms
+                            folded_text = cv_text if case_sensitive else cv_text.lower()
+                            
+                            for algo_name, matcher_key, matcher in matchers:
+                                result_key = (cv_text, matcher_key)
+                                result_keys[cv_file].append(result_key)
+                                if result_key not in analysis_cache:
+                                    tasks[result_key] = (cv_file, algo_name, matcher, folded_text)
+                        
+                        update_every = max(1, len(tasks) // PROGRESS_UPDATES)
+                        
+                        # Analyses run one after another. Each one takes milliseconds, and running the algorithms
+                        # side by side would skew the execution times the comparison tab is built on
+                        for done, (result_key, (cv_file, algo_name, matcher, folded_text)) in enumerate(tasks.items(), 1):
+                            analysis_cache[result_key] = matcher.analyze(folded_text, folded=True)
+                            
+                            # Only refresh the page every few analyses, fast algorithms finish far quicker
+                            # than the browser can be updated
+                            if done % update_every == 0 or done == len(tasks):
+                                status_text.text(f"Analyzed {cv_file} with {algo_name}...")
+                                progress_bar.progress(done / len(tasks))
+                        
+                        for cv_file, keys in result_keys.items():
+                            cv_results[cv_file] = [analysis_cache[result_key] for result_key in keys]
+                        
+                        # Likewise only keep the results of this run's CVs and matchers
+                        st.session_state['analysis_cache'] = {
+                            result_key: analysis_cache[result_key]
+                            for keys in result_keys.values()
+                            for result_key in keys
+                        }
                         
                         progress_bar.empty()
                         status_text.empty()
                         
-                        # Store results in session state
+                        # Store results in session state. The tables derived from them are built once here instead of
+                        # on every rerun, since every widget interaction re-executes the whole script
                         st.session_state['cv_results'] = cv_results
+                        df_results = performance_metrics.aggregate_results(cv_results)
+                        st.session_state['df_results'] = df_results
+                        st.session_state['df_comparison'] = performance_metrics.build_algorithm_comparison(df_results)
+                        
+                        # Serialize the exports once as well, the download buttons and the save button share the bytes
+                        st.session_state['csv_export'] = df_results.to_csv(index=False, lineterminator='\n').encode('utf-8')
+                        st.session_state['json_export'] = orjson.dumps(cv_results, option=orjson.OPT_INDENT_2)
+                        
+                        # Without a full scan the searches stop at each keyword's first match and brute force
+                        # reports its best case, so the comparison counts cannot be compared between algorithms
+                        st.session_state['exact_comparisons'] = full_scan
                         st.session_state['analysis_complete'] = True
                         
                         st.success("✅ Analysis Complete!")
@@ -399,8 +517,8 @@ def main():
         if 'analysis_complete' in st.session_state and st.session_state['analysis_complete']:
             cv_results = st.session_state['cv_results']
             
-            # Aggregate results
-            df_results = performance_metrics.aggregate_results(cv_results)
+            # Aggregated results (computed once when the analysis finished)
+            df_results = st.session_state['df_results']
             
             # Display summary metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -519,18 +637,14 @@ def main():
                     st.write(f"**{i}.** {cv_file} - {score:.2f}%")
             
             with col2:
-                # Create bar chart for top CVs
+                # Create bar chart for top CVs. Vega-Lite (Altair) is already loaded by Streamlit, so this small
+                # chart does not need the Plotly.js bundle and figure spec sent on every rerun
                 top_10_df = pd.DataFrame(rankings[:10], columns=['CV', 'Score'])
-                fig = px.bar(
-                    top_10_df,
-                    x='Score',
-                    y='CV',
-                    orientation='h',
-                    title='Top 10 CVs by Relevance Score',
-                    labels={'Score': 'Relevance Score (%)', 'CV': 'CV File'}
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                chart = alt.Chart(top_10_df, title='Top 10 CVs by Relevance Score').mark_bar().encode(
+                    x=alt.X('Score', title='Relevance Score (%)'),
+                    y=alt.Y('CV', title='CV File', sort='-x')
+                ).properties(height=400)
+                st.altair_chart(chart, use_container_width=True)
             
         else:
             st.info("👈 Please complete the job description and start analysis in the first tab.")
@@ -540,37 +654,29 @@ def main():
         st.header("📋 Analysis Summary")
         
         if 'analysis_complete' in st.session_state and st.session_state['analysis_complete']:
-            cv_results = st.session_state['cv_results']
-            df_results = performance_metrics.aggregate_results(cv_results)
+            df_results = st.session_state['df_results']
             
             st.markdown("### 📊 Quick Overview of All CVs")
             st.markdown("*At-a-glance summary of each candidate's profile with key metrics*")
             
             st.divider()
             
-            # Group by CV and create summary cards
-            cv_summaries = []
-            for cv_file in sorted(cv_results.keys()):
-                cv_data = df_results[df_results['CV File'] == cv_file]
-                
-                if not cv_data.empty:
-                    # Get average metrics across all algorithms for this CV
-                    avg_relevance = cv_data['Relevance Score (%)'].mean()
-                    avg_exec_time = cv_data['Execution Time (ms)'].mean()
-                    total_keywords = len(st.session_state['keywords'])
-                    matches = cv_data.iloc[0]['Matches']
-                    matched_keywords = cv_data.iloc[0]['Matched Keywords']
-                    missing_keywords = cv_data.iloc[0]['Missing Keywords']
-                    
-                    cv_summaries.append({
-                        'cv_file': cv_file,
-                        'avg_relevance': avg_relevance,
-                        'avg_exec_time': avg_exec_time,
-                        'matches': matches,
-                        'total_keywords': total_keywords,
-                        'matched_keywords': matched_keywords,
-                        'missing_keywords': missing_keywords
-                    })
+            # Group by CV and create summary cards, averaging metrics across all algorithms
+            # for every CV in one grouped pass (keywords are the same for all algorithms)
+            cv_summaries = (
+                df_results.groupby('CV File', sort=True)
+                .agg(
+                    avg_relevance=('Relevance Score (%)', 'mean'),
+                    avg_exec_time=('Execution Time (ms)', 'mean'),
+                    matches=('Matches', 'first'),
+                    matched_keywords=('Matched Keywords', 'first'),
+                    missing_keywords=('Missing Keywords', 'first')
+                )
+                .reset_index()
+                .rename(columns={'CV File': 'cv_file'})
+                .assign(total_keywords=len(st.session_state['keywords']))
+                .to_dict('records')
+            )
             
             # Sort by relevance score (descending)
             cv_summaries.sort(key=lambda x: x['avg_relevance'], reverse=True)
@@ -654,9 +760,9 @@ def main():
                     with col_skills1:
                         st.markdown("**✅ Matched Skills:**")
                         if summary['matched_keywords']:
+                            # One markdown call for the whole list instead of one element per skill
                             matched_list = summary['matched_keywords'].split(', ')
-                            for skill in matched_list:
-                                st.markdown(f"- ✓ {skill}")
+                            st.markdown('\n'.join(f"- ✓ {skill}" for skill in matched_list))
                         else:
                             st.info("No skills matched")
                     
@@ -664,8 +770,7 @@ def main():
                         st.markdown("**❌ Missing Skills:**")
                         if summary['missing_keywords']:
                             missing_list = summary['missing_keywords'].split(', ')
-                            for skill in missing_list:
-                                st.markdown(f"- ✗ {skill}")
+                            st.markdown('\n'.join(f"- ✗ {skill}" for skill in missing_list))
                         else:
                             st.success("All skills present!")
                 
@@ -700,49 +805,30 @@ def main():
         st.header("📈 Algorithm Performance Comparison")
         
         if 'analysis_complete' in st.session_state and st.session_state['analysis_complete']:
-            cv_results = st.session_state['cv_results']
-            
-            # Calculate average metrics across all CVs for each algorithm
-            algo_metrics = {}
-            
-            for cv_file, results in cv_results.items():
-                for result in results:
-                    algo_name = result['algorithm']
-                    if algo_name not in algo_metrics:
-                        algo_metrics[algo_name] = {
-                            'execution_times': [],
-                            'comparisons': [],
-                            'relevance_scores': []
-                        }
-                    
-                    algo_metrics[algo_name]['execution_times'].append(result['execution_time'])
-                    algo_metrics[algo_name]['comparisons'].append(result['comparisons'])
-                    algo_metrics[algo_name]['relevance_scores'].append(result['relevance_score'])
-            
-            # Calculate averages
-            algo_comparison = []
-            for algo_name, metrics in algo_metrics.items():
-                algo_comparison.append({
-                    'Algorithm': algo_name,
-                    'Avg Execution Time (ms)': sum(metrics['execution_times']) / len(metrics['execution_times']),
-                    'Avg Comparisons': sum(metrics['comparisons']) / len(metrics['comparisons']),
-                    'Avg Relevance Score (%)': sum(metrics['relevance_scores']) / len(metrics['relevance_scores'])
-                })
-            
-            df_comparison = pd.DataFrame(algo_comparison)
+            # Average metrics across all CVs for each algorithm (computed once when the analysis finished)
+            df_comparison = st.session_state['df_comparison']
+            exact_comparisons = st.session_state.get('exact_comparisons', False)
+            comparisons_note = '' if exact_comparisons else ' (estimated)'
             
             # Display metrics
             col1, col2, col3 = st.columns(3)
             
-            fastest = df_comparison.loc[df_comparison['Avg Execution Time (ms)'].idxmin()]
-            most_efficient = df_comparison.loc[df_comparison['Avg Comparisons'].idxmin()]
-            highest_score = df_comparison.loc[df_comparison['Avg Relevance Score (%)'].idxmax()]
+            # Look up each metric column and its extremes once, the insights below reuse them
+            avg_times = df_comparison['Avg Execution Time (ms)']
+            avg_comparisons = df_comparison['Avg Comparisons']
+            avg_scores = df_comparison['Avg Relevance Score (%)']
+            
+            fastest = df_comparison.loc[avg_times.idxmin()]
+            most_efficient = df_comparison.loc[avg_comparisons.idxmin()]
+            highest_score = df_comparison.loc[avg_scores.idxmax()]
+            slowest_time = avg_times.max()
+            max_comparisons = avg_comparisons.max()
             
             with col1:
                 st.metric("⚡ Fastest Algorithm", fastest['Algorithm'], f"{fastest['Avg Execution Time (ms)']:.3f} ms")
             
             with col2:
-                st.metric("🎯 Most Efficient", most_efficient['Algorithm'], f"{int(most_efficient['Avg Comparisons'])} comparisons")
+                st.metric("🎯 Most Efficient", most_efficient['Algorithm'], f"{int(most_efficient['Avg Comparisons'])} comparisons{comparisons_note}")
             
             with col3:
                 st.metric("🏆 Highest Accuracy", highest_score['Algorithm'], f"{highest_score['Avg Relevance Score (%)']:.2f}%")
@@ -771,7 +857,7 @@ def main():
                     df_comparison,
                     x='Algorithm',
                     y='Avg Comparisons',
-                    title='Average Character Comparisons',
+                    title=f'Average Character Comparisons{comparisons_note}',
                     color='Algorithm',
                     text_auto=True
                 )
@@ -806,14 +892,18 @@ def main():
                 st.write("**Time Efficiency:**")
                 speedup = performance_metrics.calculate_speedup(
                     fastest['Avg Execution Time (ms)'],
-                    df_comparison['Avg Execution Time (ms)'].max()
+                    slowest_time
                 )
                 st.write(f"- Fastest algorithm is **{speedup}x faster** than slowest")
             
             with col2:
                 st.write("**Comparison Efficiency:**")
-                efficiency = most_efficient['Avg Comparisons'] / df_comparison['Avg Comparisons'].max() * 100
-                st.write(f"- Most efficient algorithm uses **{efficiency:.1f}%** fewer comparisons")
+                if exact_comparisons:
+                    efficiency = most_efficient['Avg Comparisons'] / max_comparisons * 100
+                    st.write(f"- Most efficient algorithm uses **{efficiency:.1f}%** fewer comparisons")
+                else:
+                    st.info("Comparison counts are estimates without a full scan. "
+                            "Enable it in the sidebar and rerun the analysis to compare them.")
             
         else:
             st.info("👈 Please complete the analysis first.")
@@ -823,8 +913,9 @@ def main():
         st.header("💾 Export Analysis Data")
         
         if 'analysis_complete' in st.session_state and st.session_state['analysis_complete']:
-            cv_results = st.session_state['cv_results']
-            df_results = performance_metrics.aggregate_results(cv_results)
+            df_results = st.session_state['df_results']
+            csv_data = st.session_state['csv_export']
+            json_data = st.session_state['json_export']
             
             # Centered preview with adjustable number of rows
             left, center, right = st.columns([1, 4, 1])
@@ -849,7 +940,6 @@ def main():
             st.subheader("📄 Export Options")
             
             # CSV export
-            csv_data = df_results.to_csv(index=False)
             st.download_button(
                 label="📥 Download Results as CSV",
                 data=csv_data,
@@ -859,7 +949,6 @@ def main():
             )
             
             # JSON export
-            json_data = json.dumps(cv_results, indent=2)
             st.download_button(
                 label="📥 Download Results as JSON",
                 data=json_data,
@@ -874,12 +963,13 @@ def main():
                 
                 # Save CSV
                 csv_path = f"results/analysis_results_{timestamp}.csv"
-                df_results.to_csv(csv_path, index=False)
+                with open(csv_path, 'wb') as f:
+                    f.write(csv_data)
                 
                 # Save JSON
                 json_path = f"results/performance_summary_{timestamp}.json"
-                with open(json_path, 'w') as f:
-                    json.dump(cv_results, f, indent=2)
+                with open(json_path, 'wb') as f:
+                    f.write(json_data)
                 
                 st.success(f"✅ Results saved to `results/` folder!")
         
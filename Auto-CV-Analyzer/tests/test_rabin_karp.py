@@ -0,0 +1,42 @@
+"""
+Regression tests for the Rabin-Karp keyword search.
+"""
+
+import unittest
+
+from algorithms import brute_force, rabin_karp
+
+
+class TestRabinKarpCaseFolding(unittest.TestCase):
+    """Keywords beyond Latin-1 whose lower case form is Latin-1."""
+
+    def test_capital_sharp_s_matches_folded_text(self):
+        result = rabin_karp.analyze_text('Straße', ['STRAẞE'])
+        self.assertEqual(result['matched_keywords'], ['STRAẞE'])
+        self.assertEqual(result['keyword_positions'], {'STRAẞE': 1})
+
+    def test_capital_sharp_s_matches_prefolded_text(self):
+        # The app lower cases every CV once and passes it with folded=True
+        result = rabin_karp.analyze_text('Straße'.lower(), ['STRAẞE'], folded=True)
+        self.assertEqual(result['matched_keywords'], ['STRAẞE'])
+
+    def test_kelvin_sign(self):
+        result = rabin_karp.analyze_text('5 k run', ['\u212a run'])
+        self.assertEqual(result['matched_keywords'], ['\u212a run'])
+
+    def test_keyword_beyond_latin1_in_latin1_text(self):
+        result = rabin_karp.analyze_text('price in euro', ['€'], case_sensitive=True)
+        self.assertEqual(result['missing_keywords'], ['€'])
+
+    def test_same_matches_as_brute_force(self):
+        text = 'Straße, STRASSE, 5 \u212a, café and €10'
+        keywords = ['straße', 'STRAẞE', 'k', '\u212a', 'CAFÉ', '€1', 'missing']
+        for case_sensitive in (False, True):
+            expected = brute_force.analyze_text(text, keywords, case_sensitive)
+            result = rabin_karp.analyze_text(text, keywords, case_sensitive)
+            self.assertEqual(result['matched_keywords'], expected['matched_keywords'])
+            self.assertEqual(result['keyword_positions'], expected['keyword_positions'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,16 +3,26 @@ File reader utilities for extracting text from PDF, DOCX, TXT, and JSON files.
 """
 
 import os
+import re
 import json
 import io
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
+import orjson
 import pdfplumber
 import docx2txt
 
+try: # PyMuPDF is optional, when installed it extracts PDF text many times faster than pdfplumber
+    import fitz
+except ImportError:
+    fitz = None
+
+# Every integer outside orjson's 64-bit range (below -2^63 or above 2^64 - 1) has at least 19 digits
+_RE_LONG_DIGITS = re.compile(rb'\d{19}')
+
 
 def extract_text_from_pdf(file_path: str = None, file_content: bytes = None) -> str:
     """
-    Extract text from PDF file using pdfplumber.
+    Extract text from PDF file using PyMuPDF if installed, otherwise pdfplumber.
     
     Args:
         file_path: Path to the PDF file
@@ -22,26 +32,64 @@ def extract_text_from_pdf(file_path: str = None, file_content: bytes = None) ->
         Extracted text as string
     """
     try:
-        text_content = []
+        if fitz is not None:
+            return extract_text_from_pdf_pymupdf(file_path, file_content)
         
         if file_content:
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
+            source = io.BytesIO(file_content)
         elif file_path:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
+            source = file_path
+        else:
+            return ""
+        
+        # Write each page's text to one buffer and release the page's caches once its text is read.
+        # pdf.pages still keeps every Page object, but they no longer hold their parsed chars and layout
+        text_content = io.StringIO()
+        
+        with pdfplumber.open(source) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text()
+                if text:
+                    text_content.write(text)
+                    text_content.write('\n')
+                
+                # extract_text() keeps the page's text map, which holds every char, in an lru_cache that
+                # flush_cache() does not clear. page.close() clears both on pdfplumber versions that have it
+                if hasattr(page, 'close'):
+                    page.close()
+                else:
+                    page.flush_cache()
+                    page.get_textmap.cache_clear()
         
-        return '\n'.join(text_content).strip()
+        return text_content.getvalue().strip()
     except Exception as e:
         return f"Error extracting PDF: {str(e)}"
 
 
+def extract_text_from_pdf_pymupdf(file_path: str = None, file_content: bytes = None) -> str:
+    """
+    Extract text from PDF file using PyMuPDF (C++ backed, much faster than pdfplumber).
+    
+    Args:
+        file_path: Path to the PDF file
+        file_content: Binary content of the PDF file
+        
+    Returns:
+        Extracted text as string
+    """
+    if file_content:
+        pdf = fitz.open(stream=file_content, filetype='pdf')
+    elif file_path:
+        pdf = fitz.open(file_path)
+    else:
+        return ""
+    
+    with pdf:
+        text_content = [page.get_text('text') for page in pdf]
+    
+    return '\n'.join(text for text in text_content if text).strip()
+
+
 def extract_text_from_docx(file_path: str = None, file_content: bytes = None) -> str:
     """
     Extract text from DOCX file using docx2txt.
@@ -118,6 +166,32 @@ def parse_job_description_txt(text: str) -> tuple:
         return "", []
 
 
+def load_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document with orjson, falling back to the standard json module.
+    
+    orjson rejects some documents json accepts (NaN, Infinity, lone surrogate
+    escapes) and turns integers beyond 64 bits into floats, so those are parsed
+    with json to load exactly as before.
+    
+    Args:
+        raw: Binary content of the JSON document
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON for either parser
+    """
+    if not _RE_LONG_DIGITS.search(raw): # A long digit run may be an out-of-range integer, leave it to json
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    
+    return json.loads(raw)
+
+
 def extract_text_from_json(file_path: str = None, file_content: bytes = None) -> str:
     """
     Extract text from JSON file.
@@ -131,27 +205,42 @@ def extract_text_from_json(file_path: str = None, file_content: bytes = None) ->
     """
     try:
         if file_content:
-            data = json.loads(file_content.decode('utf-8'))
+            raw = file_content
         elif file_path:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
         else:
             return ""
         
-        # Extract all text values from JSON recursively
-        def extract_values(obj):
+        data = load_json(raw)
+        
+        # Collect all leaf values of the JSON in document order with an explicit stack, joining once at the end
+        values = []
+        stack = [data]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
-                return ' '.join(str(v) for v in obj.values() if v)
+                stack.extend(reversed(list(obj.values())))
             elif isinstance(obj, list):
-                return ' '.join(extract_values(item) for item in obj)
-            else:
-                return str(obj) if obj else ''
+                stack.extend(reversed(obj))
+            elif obj:
+                values.append(str(obj))
         
-        return extract_values(data).strip()
+        return ' '.join(values).strip()
     except Exception as e:
         return f"Error extracting JSON: {str(e)}"
 
 
+# Text extractor for every supported file extension
+_EXT_DISPATCH = {
+    '.pdf': extract_text_from_pdf,
+    '.docx': extract_text_from_docx,
+    '.doc': extract_text_from_docx,
+    '.txt': extract_text_from_txt,
+    '.json': extract_text_from_json
+}
+
+
 def read_file(file_path: str = None, file_content: bytes = None, filename: str = None) -> str:
     """
     Read and extract text from file based on extension.
@@ -173,16 +262,11 @@ def read_file(file_path: str = None, file_content: bytes = None, filename: str =
         return "Error: No file path or filename provided"
     
     # Extract text based on file type
-    if ext == '.pdf':
-        return extract_text_from_pdf(file_path, file_content)
-    elif ext in ['.docx', '.doc']:
-        return extract_text_from_docx(file_path, file_content)
-    elif ext == '.txt':
-        return extract_text_from_txt(file_path, file_content)
-    elif ext == '.json':
-        return extract_text_from_json(file_path, file_content)
-    else:
+    extract = _EXT_DISPATCH.get(ext)
+    if extract is None:
         return f"Unsupported file format: {ext}"
+    
+    return extract(file_path, file_content)
 
 
 def load_cvs_from_directory(directory_path: str) -> Dict[str, str]:
@@ -200,17 +284,26 @@ def load_cvs_from_directory(directory_path: str) -> Dict[str, str]:
     if not os.path.exists(directory_path):
         return cvs
     
-    supported_extensions = ['.pdf', '.docx', '.doc', '.txt', '.json']
-    
     for filename in os.listdir(directory_path):
         file_path = os.path.join(directory_path, filename)
         
         if os.path.isfile(file_path):
             ext = os.path.splitext(filename)[1].lower()
             
-            if ext in supported_extensions:
+            if ext in _EXT_DISPATCH:
                 text = read_file(file_path=file_path)
                 if text and not text.startswith("Error"):
                     cvs[filename] = text
     
     return cvs
+    
+    # The files are read on a thread pool. pdfplumber and docx2txt parse in pure Python and hold the GIL,
+    # so the threads only overlap file reads and zlib decompression. map keeps the directory order of the results
+    with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+        texts = executor.map(lambda filename: read_file(file_path=os.path.join(directory_path, filename)), filenames)
+        
+        for filename, text in zip(filenames, texts):
+            if text and not text.startswith("Error"):
+                cvs[filename] = text
+    
+    return cvs
@@ -3,6 +3,7 @@ Performance metrics tracking for algorithm comparison.
 """
 
 from typing import List, Dict
+import numpy as np
 import pandas as pd
 
 
@@ -56,23 +57,64 @@ def aggregate_results(cv_results: Dict[str, List[Dict]]) -> pd.DataFrame:
     Returns:
         DataFrame with aggregated results
     """
-    all_results = []
+    # Build one list per column instead of one dict per row, so pandas gets the columns directly
+    cv_files = []
+    algorithms = []
+    matches = []
+    total_keywords = []
+    relevance_scores = []
+    execution_times = []
+    comparisons = []
+    matched_keywords = []
+    missing_keywords = []
     
     for cv_file, results in cv_results.items():
         for result in results:
-            all_results.append({
-                'CV File': cv_file,
-                'Algorithm': result.get('algorithm', 'Unknown'),
-                'Matches': result.get('matches', 0),
-                'Total Keywords': result.get('total_keywords', 0),
-                'Relevance Score (%)': result.get('relevance_score', 0),
-                'Execution Time (ms)': result.get('execution_time', 0),
-                'Comparisons': result.get('comparisons', 0),
-                'Matched Keywords': ', '.join(result.get('matched_keywords', [])),
-                'Missing Keywords': ', '.join(result.get('missing_keywords', []))
-            })
-    
-    return pd.DataFrame(all_results)
+            cv_files.append(cv_file)
+            algorithms.append(result.get('algorithm', 'Unknown'))
+            matches.append(result.get('matches', 0))
+            total_keywords.append(result.get('total_keywords', 0))
+            relevance_scores.append(result.get('relevance_score', 0))
+            execution_times.append(result.get('execution_time', 0))
+            comparisons.append(result.get('comparisons', 0))
+            matched_keywords.append(', '.join(result.get('matched_keywords', [])))
+            missing_keywords.append(', '.join(result.get('missing_keywords', [])))
+    
+    return pd.DataFrame({
+        'CV File': cv_files,
+        'Algorithm': algorithms,
+        'Matches': np.asarray(matches, dtype=np.int64),
+        'Total Keywords': np.asarray(total_keywords, dtype=np.int64),
+        'Relevance Score (%)': np.asarray(relevance_scores, dtype=np.float64),
+        'Execution Time (ms)': np.asarray(execution_times, dtype=np.float64),
+        'Comparisons': np.asarray(comparisons, dtype=np.int64),
+        'Matched Keywords': matched_keywords,
+        'Missing Keywords': missing_keywords
+    })
+
+
+def build_algorithm_comparison(df_results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average the metrics of each algorithm across all CVs.
+    
+    Args:
+        df_results: Aggregated results DataFrame (see aggregate_results)
+        
+    Returns:
+        DataFrame with one row of average metrics per algorithm
+    """
+    # One grouped mean over the result columns, algorithms keep the order in which they were run
+    return (
+        df_results
+        .groupby('Algorithm', sort=False)[['Execution Time (ms)', 'Comparisons', 'Relevance Score (%)']]
+        .mean()
+        .reset_index()
+        .rename(columns={
+            'Execution Time (ms)': 'Avg Execution Time (ms)',
+            'Comparisons': 'Avg Comparisons',
+            'Relevance Score (%)': 'Avg Relevance Score (%)'
+        })
+    )
 
 
 def get_best_algorithm(results: List[Dict], criterion: str = 'time') -> str:
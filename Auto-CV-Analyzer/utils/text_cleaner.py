@@ -3,8 +3,51 @@ Text cleaning and preprocessing utilities for CV analysis.
 """
 
 import re
+from collections import Counter
 from typing import List, Set
 
+from algorithms import regex_search
+
+
+# Patterns are compiled once at import instead of going through the re module's cache on every call
+_RE_WS = re.compile(r'\s+')
+_RE_SPECIAL = re.compile(r'[^\w\s\.,;:\-\'\"()]+')
+_RE_URL = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_RE_EMAIL = re.compile(r'\S+@\S+')
+_RE_DIGITS = re.compile(r'\d+')
+_RE_WORD = re.compile(r'\b\w+\b')
+
+# Common skill-related keywords and phrases
+_SKILL_PATTERNS = [
+    re.compile(r'(?:skills?|requirements?|qualifications?|experience in):?\s*([^\n.]+)', re.IGNORECASE),
+    re.compile(r'(?:must have|should have|required):?\s*([^\n.]+)', re.IGNORECASE),
+    re.compile(r'(?:knowledge of|proficiency in|expertise in):?\s*([^\n.]+)', re.IGNORECASE),
+]
+
+# Common stop words left out of word frequencies
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which'
+})
+
+# Common programming languages, tools, and technologies looked for when no skill phrase is found
+_COMMON_SKILLS = (
+    'Python', 'Java', 'JavaScript', 'C++', 'C#', 'SQL', 'R',
+    'Machine Learning', 'Deep Learning', 'Data Analysis', 'Statistics',
+    'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'Scikit-learn',
+    'Git', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
+    'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask',
+    'Excel', 'Tableau', 'Power BI', 'Spark', 'Hadoop',
+    'Communication', 'Teamwork', 'Leadership', 'Problem Solving'
+)
+
+# All skills compiled once into the regex matcher's single alternation, which also finds overlapping
+# skills (Java in JavaScript)
+_COMMON_SKILL_SCAN = regex_search.compile_patterns(list(_COMMON_SKILLS))
+
 
 def clean_text(text: str) -> str:
     """
@@ -17,10 +60,10 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _RE_WS.sub(' ', text)
     
     # Remove special characters but keep letters, numbers, and basic punctuation
-    text = re.sub(r'[^\w\s\.,;:\-\'\"()]+', ' ', text)
+    text = _RE_SPECIAL.sub(' ', text)
     
     # Remove multiple spaces
     text = ' '.join(text.split())
@@ -72,20 +115,16 @@ def normalize_keywords(keywords: List[str]) -> List[str]:
     Returns:
         Normalized list of keywords
     """
-    normalized = []
-    seen = set()
+    # Keyed by the lower cased keyword so duplicates are dropped case-insensitively,
+    # keeping the first spelling in the original order
+    normalized = {}
     
     for keyword in keywords:
-        # Clean the keyword
         kw = keyword.strip()
-        kw_lower = kw.lower()
-        
-        # Avoid duplicates (case-insensitive check)
-        if kw and kw_lower not in seen:
-            normalized.append(kw)
-            seen.add(kw_lower)
+        if kw:
+            normalized.setdefault(kw.lower(), kw)
     
-    return normalized
+    return list(normalized.values())
 
 
 def extract_skills_from_job_description(job_text: str) -> List[str]:
@@ -98,39 +137,20 @@ def extract_skills_from_job_description(job_text: str) -> List[str]:
     Returns:
         List of extracted skills/keywords
     """
-    # Common skill-related keywords and phrases
-    skill_patterns = [
-        r'(?:skills?|requirements?|qualifications?|experience in):?\s*([^\n.]+)',
-        r'(?:must have|should have|required):?\s*([^\n.]+)',
-        r'(?:knowledge of|proficiency in|expertise in):?\s*([^\n.]+)',
-    ]
-    
     extracted_skills = []
     
     # Try pattern matching
-    for pattern in skill_patterns:
-        matches = re.findall(pattern, job_text, re.IGNORECASE)
+    for pattern in _SKILL_PATTERNS:
+        matches = pattern.findall(job_text)
         for match in matches:
             skills = extract_keywords(match)
             extracted_skills.extend(skills)
     
     # If no patterns match, try to extract from entire text
     if not extracted_skills:
-        # Look for common programming languages, tools, and technologies
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'SQL', 'R',
-            'Machine Learning', 'Deep Learning', 'Data Analysis', 'Statistics',
-            'TensorFlow', 'PyTorch', 'Pandas', 'NumPy', 'Scikit-learn',
-            'Git', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
-            'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask',
-            'Excel', 'Tableau', 'Power BI', 'Spark', 'Hadoop',
-            'Communication', 'Teamwork', 'Leadership', 'Problem Solving'
-        ]
-        
-        job_text_lower = job_text.lower()
-        for skill in common_skills:
-            if skill.lower() in job_text_lower:
-                extracted_skills.append(skill)
+        # Look for common programming languages, tools, and technologies in one scan of the text
+        all_positions, _ = regex_search.search_compiled(job_text, _COMMON_SKILL_SCAN, first_only=True)
+        extracted_skills = [skill for skill, positions in zip(_COMMON_SKILLS, all_positions) if positions]
     
     return normalize_keywords(extracted_skills)
 
@@ -147,17 +167,17 @@ def preprocess_for_matching(text: str, remove_numbers: bool = False) -> str:
         Preprocessed text
     """
     # Remove URLs
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = _RE_URL.sub('', text)
     
     # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
+    text = _RE_EMAIL.sub('', text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _RE_WS.sub(' ', text)
     
     # Optionally remove numbers
     if remove_numbers:
-        text = re.sub(r'\d+', '', text)
+        text = _RE_DIGITS.sub('', text)
     
     return text.strip()
 
@@ -173,26 +193,9 @@ def get_word_frequency(text: str, top_n: int = 50) -> List[tuple]:
     Returns:
         List of (word, frequency) tuples
     """
-    # Tokenize and count words
-    words = re.findall(r'\b\w+\b', text.lower())
-    
-    # Remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these',
-        'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which'
-    }
-    
-    filtered_words = [w for w in words if w not in stop_words and len(w) > 2]
-    
-    # Count frequency
-    word_freq = {}
-    for word in filtered_words:
-        word_freq[word] = word_freq.get(word, 0) + 1
-    
-    # Sort by frequency
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    # Tokenize and count words, leaving out common stop words
+    words = _RE_WORD.findall(text.lower())
+    word_freq = Counter(w for w in words if len(w) > 2 and w not in _STOP_WORDS)
     
-    return sorted_words[:top_n]
+    # Most frequent first, ties keep the order in which the words first appear
+    return word_freq.most_common(top_n)